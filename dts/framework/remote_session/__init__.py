@@ -20,7 +20,7 @@
 from .interactive_remote_session import InteractiveRemoteSession
 from .interactive_shell import InteractiveShell
 from .python_shell import PythonShell
-from .remote_session import CommandResult, RemoteSession
+from .remote_session import HISTORY_SIZE, CommandResult, RemoteSession
 from .ssh_session import SSHSession
 from .testpmd_shell import TestPmdShell
 
@@ -7,11 +7,15 @@
 
 This module contains the abstract base class for remote sessions and defines
 the structure of the result of a command execution.
+
+Attributes:
+    HISTORY_SIZE: The number of the most recently executed commands kept in a session's history.
 """
 
 
 import dataclasses
 from abc import ABC, abstractmethod
+from collections import deque
 from pathlib import PurePath
 
 from framework.config import NodeConfiguration
@@ -19,6 +23,8 @@
 from framework.logger import DTSLOG
 from framework.settings import SETTINGS
 
+HISTORY_SIZE: int = 10
+
 
 @dataclasses.dataclass(slots=True, frozen=True)
 class CommandResult:
@@ -65,7 +71,7 @@ class RemoteSession(ABC):
         username: The username used in the connection.
         password: The password used in the connection. Most frequently empty,
             as the use of passwords is discouraged.
-        history: The executed commands during this session.
+        history: The last :data:`HISTORY_SIZE` commands executed during this session.
     """
 
     name: str
@@ -74,7 +80,7 @@ class RemoteSession(ABC):
     port: int | None
     username: str
     password: str
-    history: list[CommandResult]
+    history: deque[CommandResult]
     _logger: DTSLOG
     _node_config: NodeConfiguration
 
@@ -105,7 +111,7 @@ def __init__(
             self.port = int(port)
         self.username = node_config.user
         self.password = node_config.password or ""
-        self.history = []
+        self.history = deque(maxlen=HISTORY_SIZE)
 
         self._logger = logger
         self._logger.info(f"Connecting to {self.username}@{self.hostname}.")
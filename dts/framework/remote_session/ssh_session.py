@@ -30,6 +30,9 @@ class SSHSession(RemoteSession):
 
     The connection is implemented with
     `the Fabric Python library <https://docs.fabfile.org/en/latest/>`_.
+    The connection is opened once and all commands are executed over its SSH transport,
+    which is configured to send "keep alive" packets every 30 seconds, so that the connection
+    isn't dropped between commands sent far apart.
 
     Attributes:
         session: The underlying Fabric SSH connection.
@@ -73,6 +76,9 @@ def _connect(self) -> None:
                 break
         else:
             raise SSHConnectionError(self.hostname, errors)
+        # the transport may be idle for a long time between commands (e.g. while the TG
+        # is sending traffic), so we have to set a keepalive to keep reusing it
+        self.session.transport.set_keepalive(30)
 
     def is_alive(self) -> bool:
         """Overrides :meth:`~.remote_session.RemoteSession.is_alive`."""
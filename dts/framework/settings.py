@@ -58,6 +58,11 @@
 
     Re-run each test case this many times in case of a failure.
 
+.. option:: --parallel-tests
+.. envvar:: DTS_PARALLEL_TESTS
+
+    The number of test cases to execute concurrently in test suites which allow it.
+
 The module provides one key module-level variable:
 
 Attributes:
@@ -174,6 +179,8 @@ class Settings:
     test_cases: list[str] = field(default_factory=list)
     #:
     re_run: int = 0
+    #:
+    parallel_tests: int = 1
 
 
 SETTINGS: Settings = Settings()
@@ -267,6 +274,15 @@ def _get_parser() -> argparse.ArgumentParser:
         "if a test failure occurs",
     )
 
+    parser.add_argument(
+        "--parallel-tests",
+        action=_env_arg("DTS_PARALLEL_TESTS"),
+        default=SETTINGS.parallel_tests,
+        type=int,
+        help="[DTS_PARALLEL_TESTS] The maximum number of test cases to execute concurrently "
+        "in test suites which declare their test cases independent.",
+    )
+
     return parser
 
 
@@ -290,4 +306,5 @@ def get_settings() -> Settings:
         compile_timeout=parsed_args.compile_timeout,
         test_cases=(parsed_args.test_cases.split(",") if parsed_args.test_cases else []),
         re_run=parsed_args.re_run,
+        parallel_tests=parsed_args.parallel_tests,
     )
@@ -17,9 +17,11 @@
 for gathering test suites from a Python module.
 """
 
+import functools
 import importlib
+import importlib.util
 import inspect
-import re
+from concurrent.futures import ThreadPoolExecutor
 from ipaddress import IPv4Interface, IPv6Interface, ip_interface
 from types import MethodType
 from typing import Any, ClassVar, Union
@@ -35,6 +37,7 @@
     TestCaseVerifyError,
 )
 from .logger import DTSLOG, getLogger
+from .remote_session import HISTORY_SIZE
 from .settings import SETTINGS
 from .test_result import BuildTargetResult, Result, TestCaseResult, TestSuiteResult
 from .testbed_model import Port, PortLink, SutNode, TGNode
@@ -64,6 +67,13 @@ class TestSuite(object):
     is set, in case of a test case failure, the test case will be executed again until it passes
     or it fails that many times in addition of the first failure.
 
+    If the test suite declares its test cases independent with :attr:`is_independent`, the test
+    cases may be executed concurrently. The :option:`--parallel-tests` command line argument
+    or the :envvar:`DTS_PARALLEL_TESTS` environment variable set how many at most.
+    The traffic generator is shared by all test cases, so sending and capturing traffic
+    is still done by one test case at a time. The test cases run on the same test suite object,
+    so the test cases and the test case fixtures must be thread-safe.
+
     The methods named ``[set_up|tear_down]_[suite|test_case]`` should be overridden in subclasses
     if the appropriate test suite/test case fixtures are needed.
 
@@ -80,19 +90,50 @@ class TestSuite(object):
     #: Whether the test suite is blocking. A failure of a blocking test suite
     #: will block the execution of all subsequent test suites in the current build target.
     is_blocking: ClassVar[bool] = False
+    #: Whether the test cases of the test suite are independent of each other. Independent test
+    #: cases don't modify the SUT or TG configuration (such as port or driver configuration)
+    #: and may thus be executed concurrently. Their traffic is still sent and captured
+    #: one test case at a time. The test cases and the ``[set_up|tear_down]_test_case`` fixtures
+    #: of concurrently executed test cases run on the same test suite object at the same time,
+    #: so they must be thread-safe.
+    is_independent: ClassVar[bool] = False
+    _functional_test_case_names: ClassVar[tuple[str, ...]] = ()
     _logger: DTSLOG
-    _test_cases_to_run: list[str]
+    _executing_concurrently: bool
+    _test_cases_to_run: frozenset[str]
     _func: bool
     _result: TestSuiteResult
     _port_links: list[PortLink]
     _sut_port_ingress: Port
     _sut_port_egress: Port
+    _sut_mac_address_ingress: str
+    _sut_mac_address_egress: str
     _sut_ip_address_ingress: Union[IPv4Interface, IPv6Interface]
     _sut_ip_address_egress: Union[IPv4Interface, IPv6Interface]
     _tg_port_ingress: Port
     _tg_port_egress: Port
+    _tg_mac_address_ingress: str
+    _tg_mac_address_egress: str
     _tg_ip_address_ingress: Union[IPv4Interface, IPv6Interface]
     _tg_ip_address_egress: Union[IPv4Interface, IPv6Interface]
+    _tg_ip_address_ingress_str: str
+    _tg_ip_address_egress_str: str
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Find the functional test cases of the subclass.
+
+        The test cases are found once, when the subclass is defined, and not each time
+        a test suite is run.
+
+        Args:
+            kwargs: The keyword arguments that will be passed to the superclass's method.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._functional_test_case_names = tuple(
+            name
+            for name, _ in inspect.getmembers(cls, inspect.isfunction)
+            if name.startswith("test_") and not name.startswith("test_perf_")
+        )
 
     def __init__(
         self,
@@ -119,9 +160,9 @@ def __init__(
         self.sut_node = sut_node
         self.tg_node = tg_node
         self._logger = getLogger(self.__class__.__name__)
-        self._test_cases_to_run = test_cases
-        self._test_cases_to_run.extend(SETTINGS.test_cases)
+        self._test_cases_to_run = frozenset(test_cases).union(SETTINGS.test_cases)
         self._func = func
+        self._executing_concurrently = False
         self._result = build_target_result.add_test_suite(self.__class__.__name__)
         self._port_links = []
         self._process_links()
@@ -133,20 +174,41 @@ def __init__(
             self._port_links[1].sut_port,
             self._port_links[1].tg_port,
         )
+        # the MAC addresses are put into and checked in each packet,
+        # so store them directly in the test suite; these are snapshots taken here,
+        # changes made to the ports afterwards (e.g. updated port attributes) aren't reflected
+        self._sut_mac_address_ingress = self._sut_port_ingress.mac_address
+        self._sut_mac_address_egress = self._sut_port_egress.mac_address
+        self._tg_mac_address_ingress = self._tg_port_ingress.mac_address
+        self._tg_mac_address_egress = self._tg_port_egress.mac_address
         self._sut_ip_address_ingress = ip_interface("192.168.100.2/24")
         self._sut_ip_address_egress = ip_interface("192.168.101.2/24")
         self._tg_ip_address_egress = ip_interface("192.168.100.3/24")
         self._tg_ip_address_ingress = ip_interface("192.168.101.3/24")
+        self._update_ip_address_strings()
 
     def _process_links(self) -> None:
-        """Construct links between SUT and TG ports."""
+        """Construct links between SUT and TG ports.
+
+        The links are ordered the same way as the SUT ports.
+        """
+        tg_ports = {(tg_port.peer, tg_port.identifier): tg_port for tg_port in self.tg_node.ports}
         for sut_port in self.sut_node.ports:
-            for tg_port in self.tg_node.ports:
-                if (sut_port.identifier, sut_port.peer) == (
-                    tg_port.peer,
-                    tg_port.identifier,
-                ):
-                    self._port_links.append(PortLink(sut_port=sut_port, tg_port=tg_port))
+            tg_port = tg_ports.get((sut_port.identifier, sut_port.peer))
+            if tg_port is not None:
+                self._port_links.append(PortLink(sut_port=sut_port, tg_port=tg_port))
+
+    def _update_ip_address_strings(self) -> None:
+        """Cache the string form of the IP addresses put into the packets we send.
+
+        The string form is computed in Python code each time it's accessed on the address object,
+        so we compute it once here instead of for each packet. The strings are snapshots taken
+        when the test suite is created and when the testbed is configured. A test suite changing
+        :attr:`_tg_ip_address_ingress` or :attr:`_tg_ip_address_egress` at any other time
+        must call this method afterwards.
+        """
+        self._tg_ip_address_ingress_str = self._tg_ip_address_ingress.ip.exploded
+        self._tg_ip_address_egress_str = self._tg_ip_address_egress.ip.exploded
 
     def set_up_suite(self) -> None:
         """Set up test fixtures common to all test cases.
@@ -182,33 +244,47 @@ def configure_testbed_ipv4(self, restore: bool = False) -> None:
         * TG ingress port,
         * TG egress port.
 
+        The SUT and the TG are configured concurrently.
+
         Args:
             restore: If :data:`True`, will remove the configuration instead.
         """
         delete = True if restore else False
         enable = False if restore else True
-        self._configure_ipv4_forwarding(enable)
-        self.sut_node.configure_port_ip_address(
-            self._sut_ip_address_egress, self._sut_port_egress, delete
-        )
-        self.sut_node.configure_port_state(self._sut_port_egress, enable)
-        self.sut_node.configure_port_ip_address(
-            self._sut_ip_address_ingress, self._sut_port_ingress, delete
-        )
-        self.sut_node.configure_port_state(self._sut_port_ingress, enable)
-        self.tg_node.configure_port_ip_address(
-            self._tg_ip_address_ingress, self._tg_port_ingress, delete
-        )
-        self.tg_node.configure_port_state(self._tg_port_ingress, enable)
-        self.tg_node.configure_port_ip_address(
-            self._tg_ip_address_egress, self._tg_port_egress, delete
-        )
-        self.tg_node.configure_port_state(self._tg_port_egress, enable)
+        self._update_ip_address_strings()
+
+        def configure_sut() -> None:
+            self._configure_ipv4_forwarding(enable)
+            self.sut_node.configure_ports(
+                [
+                    (self._sut_ip_address_egress, self._sut_port_egress),
+                    (self._sut_ip_address_ingress, self._sut_port_ingress),
+                ],
+                delete,
+                enable,
+            )
+
+        def configure_tg() -> None:
+            self.tg_node.configure_ports(
+                [
+                    (self._tg_ip_address_ingress, self._tg_port_ingress),
+                    (self._tg_ip_address_egress, self._tg_port_egress),
+                ],
+                delete,
+                enable,
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(configure_sut), executor.submit(configure_tg)]
+            for future in futures:
+                future.result()
 
     def _configure_ipv4_forwarding(self, enable: bool) -> None:
         self.sut_node.configure_ipv4_forwarding(enable)
 
-    def send_packet_and_capture(self, packet: Packet, duration: float = 1) -> list[Packet]:
+    def send_packet_and_capture(
+        self, packet: Packet, duration: float = 1, stop_early: bool = False
+    ) -> list[Packet]:
         """Send and receive `packet` using the associated TG.
 
         Send `packet` through the appropriate interface and receive on the appropriate interface.
@@ -217,25 +293,76 @@ def send_packet_and_capture(self, packet: Packet, duration: float = 1) -> list[P
         Args:
             packet: The packet to send.
             duration: Capture traffic for this amount of time after sending `packet`.
+            stop_early: If :data:`True`, stop capturing as soon as a packet with the addresses
+                of the expected packet (see :meth:`get_expected_packet`) is received,
+                without waiting for `duration` to elapse. Only enable this when a single
+                matching packet is needed, the packets received after it aren't captured.
 
         Returns:
             A list of received packets.
         """
         packet = self._adjust_addresses(packet)
         return self.tg_node.send_packet_and_capture(
-            packet, self._tg_port_egress, self._tg_port_ingress, duration
+            packet,
+            self._tg_port_egress,
+            self._tg_port_ingress,
+            duration,
+            self._get_expected_addresses_filter(packet) if stop_early else None,
         )
 
+    def send_packets_and_capture(self, packets: list[Packet], duration: float = 1) -> list[Packet]:
+        """Send and receive `packets` using the associated TG.
+
+        Send all `packets` back-to-back through the appropriate interface and receive
+        on the appropriate interface in a single capture. This is much faster than sending
+        the packets one by one with :meth:`send_packet_and_capture`, as the traffic
+        is only captured once.
+        Modify the packets with l3/l2 addresses corresponding to the testbed and desired traffic.
+
+        Args:
+            packets: The packets to send.
+            duration: Capture traffic for this amount of time after sending `packets`.
+
+        Returns:
+            A list of received packets.
+        """
+        packets = [self._adjust_addresses(packet) for packet in packets]
+        return self.tg_node.send_packets_and_capture(
+            packets, self._tg_port_egress, self._tg_port_ingress, duration
+        )
+
+    def _get_expected_addresses_filter(self, packet: Packet) -> dict[str, dict[str, str]]:
+        """Describe the addresses of the packet expected to be received after sending `packet`.
+
+        These are the addresses :meth:`_verify_l2_frame` and :meth:`_verify_l3_packet` check.
+
+        Args:
+            packet: The packet to send, with adjusted addresses.
+
+        Returns:
+            The expected address field values of the Ether and IP layers.
+        """
+        addresses_filter = {"Ether": {"dst": self._tg_mac_address_ingress}}
+        if packet.haslayer(IP):
+            addresses_filter["IP"] = {
+                "src": self._tg_ip_address_egress_str,
+                "dst": self._tg_ip_address_ingress_str,
+            }
+        return addresses_filter
+
     def get_expected_packet(self, packet: Packet) -> Packet:
-        """Inject the proper L2/L3 addresses into `packet`.
+        """Inject the proper L2/L3 addresses into a copy of `packet`.
+
+        `packet` itself is not modified, so it may still be sent after the expected packet
+        has been created from it.
 
         Args:
-            packet: The packet to modify.
+            packet: The packet to create the expected packet from.
 
         Returns:
-            `packet` with injected L2/L3 addresses.
+            A copy of `packet` with injected L2/L3 addresses.
         """
-        return self._adjust_addresses(packet, expected=True)
+        return self._adjust_addresses(packet.copy(), expected=True)
 
     def _adjust_addresses(self, packet: Packet, expected: bool = False) -> Packet:
         """L2 and L3 address additions in both directions.
@@ -247,29 +374,27 @@ def _adjust_addresses(self, packet: Packet, expected: bool = False) -> Packet:
             packet: The packet to modify.
             expected: If :data:`True`, the direction is SUT -> TG,
                 otherwise the direction is TG -> SUT.
+
+        Returns:
+            `packet`, modified in place.
         """
         if expected:
             # The packet enters the TG from SUT
             # update l2 addresses
-            packet.src = self._sut_port_egress.mac_address
-            packet.dst = self._tg_port_ingress.mac_address
-
-            # The packet is routed from TG egress to TG ingress
-            # update l3 addresses
-            packet.payload.src = self._tg_ip_address_egress.ip.exploded
-            packet.payload.dst = self._tg_ip_address_ingress.ip.exploded
+            packet.src = self._sut_mac_address_egress
+            packet.dst = self._tg_mac_address_ingress
         else:
             # The packet leaves TG towards SUT
             # update l2 addresses
-            packet.src = self._tg_port_egress.mac_address
-            packet.dst = self._sut_port_ingress.mac_address
+            packet.src = self._tg_mac_address_egress
+            packet.dst = self._sut_mac_address_ingress
 
-            # The packet is routed from TG egress to TG ingress
-            # update l3 addresses
-            packet.payload.src = self._tg_ip_address_egress.ip.exploded
-            packet.payload.dst = self._tg_ip_address_ingress.ip.exploded
+        # The packet is routed from TG egress to TG ingress in both directions
+        # update l3 addresses
+        packet.payload.src = self._tg_ip_address_egress_str
+        packet.payload.dst = self._tg_ip_address_ingress_str
 
-        return Ether(packet.build())
+        return packet
 
     def verify(self, condition: bool, failure_description: str) -> None:
         """Verify `condition` and handle failures.
@@ -289,11 +414,22 @@ def verify(self, condition: bool, failure_description: str) -> None:
             self._fail_test_case_verify(failure_description)
 
     def _fail_test_case_verify(self, failure_description: str) -> None:
-        self._logger.debug("A test case failed, showing the last 10 commands executed on SUT:")
-        for command_res in self.sut_node.main_session.remote_session.history[-10:]:
+        if self._executing_concurrently:
+            # the command history is shared by all test cases and doesn't show what this one ran
+            self._logger.debug(
+                "A test case failed, not showing the commands executed on SUT and TG "
+                "since the test cases are executed concurrently."
+            )
+            raise TestCaseVerifyError(failure_description)
+        self._logger.debug(
+            f"A test case failed, showing the last {HISTORY_SIZE} commands executed on SUT:"
+        )
+        for command_res in self.sut_node.main_session.remote_session.history:
             self._logger.debug(command_res.command)
-        self._logger.debug("A test case failed, showing the last 10 commands executed on TG:")
-        for command_res in self.tg_node.main_session.remote_session.history[-10:]:
+        self._logger.debug(
+            f"A test case failed, showing the last {HISTORY_SIZE} commands executed on TG:"
+        )
+        for command_res in self.tg_node.main_session.remote_session.history:
             self._logger.debug(command_res.command)
         raise TestCaseVerifyError(failure_description)
 
@@ -311,22 +447,25 @@ def verify_packets(self, expected_packet: Packet, received_packets: list[Packet]
         Raises:
             TestCaseVerifyError: `expected_packet` is not among `received_packets`.
         """
+        # the summary of the expected packet is only computed once, not for each received packet
+        expected_packet_summary = get_packet_summaries([expected_packet])
+        self._logger.debug(f"Looking for the expected packet. {expected_packet_summary}")
         for received_packet in received_packets:
             if self._compare_packets(expected_packet, received_packet):
                 break
         else:
             self._logger.debug(
-                f"The expected packet {get_packet_summaries(expected_packet)} "
+                f"The expected packet {expected_packet_summary} "
                 f"not found among received {get_packet_summaries(received_packets)}"
             )
             self._fail_test_case_verify("An expected packet not found among received packets.")
 
     def _compare_packets(self, expected_packet: Packet, received_packet: Packet) -> bool:
         self._logger.debug(
-            f"Comparing packets: \n{expected_packet.summary()}\n{received_packet.summary()}"
+            f"Comparing the expected packet with received packet: \n{received_packet.summary()}"
         )
 
-        l3 = IP in expected_packet.layers()
+        l3 = expected_packet.haslayer(IP)
         self._logger.debug("Found l3 layer")
 
         received_payload = received_packet
@@ -337,7 +476,7 @@ def _compare_packets(self, expected_packet: Packet, received_packet: Packet) ->
             self._logger.debug(f"Expected: {expected_payload}")
             if received_payload.__class__ == expected_payload.__class__:
                 self._logger.debug("The layers are the same.")
-                if received_payload.__class__ == Ether:
+                if isinstance(received_payload, Ether):
                     if not self._verify_l2_frame(received_payload, l3):
                         return False
                 elif received_payload.__class__ == IP:
@@ -361,14 +500,14 @@ def _verify_l2_frame(self, received_packet: Ether, l3: bool) -> bool:
         self._logger.debug("Looking at the Ether layer.")
         self._logger.debug(
             f"Comparing received dst mac '{received_packet.dst}' "
-            f"with expected '{self._tg_port_ingress.mac_address}'."
+            f"with expected '{self._tg_mac_address_ingress}'."
         )
-        if received_packet.dst != self._tg_port_ingress.mac_address:
+        if received_packet.dst != self._tg_mac_address_ingress:
             return False
 
-        expected_src_mac = self._tg_port_egress.mac_address
+        expected_src_mac = self._tg_mac_address_egress
         if l3:
-            expected_src_mac = self._sut_port_egress.mac_address
+            expected_src_mac = self._sut_mac_address_egress
         self._logger.debug(
             f"Comparing received src mac '{received_packet.src}' "
             f"with expected '{expected_src_mac}'."
@@ -426,19 +565,69 @@ def run(self) -> None:
     def _execute_test_suite(self) -> None:
         """Execute all test cases scheduled to be executed in this suite."""
         if self._func:
-            for test_case_method in self._get_functional_test_cases():
-                test_case_name = test_case_method.__name__
-                test_case_result = self._result.add_test_case(test_case_name)
-                all_attempts = SETTINGS.re_run + 1
-                attempt_nr = 1
-                self._run_test_case(test_case_method, test_case_result)
-                while not test_case_result and attempt_nr < all_attempts:
-                    attempt_nr += 1
-                    self._logger.info(
-                        f"Re-running FAILED test case '{test_case_name}'. "
-                        f"Attempt number {attempt_nr} out of {all_attempts}."
+            all_attempts = SETTINGS.re_run + 1
+            if self.is_independent and SETTINGS.parallel_tests > 1:
+                self._execute_test_cases_concurrently(all_attempts)
+            else:
+                for test_case_method in self._get_functional_test_cases():
+                    test_case_result = self._result.add_test_case(test_case_method.__name__)
+                    self._run_test_case_attempts(test_case_method, test_case_result, all_attempts)
+
+    def _execute_test_cases_concurrently(self, all_attempts: int) -> None:
+        """Execute the functional test cases in a pool of at most `parallel_tests` workers.
+
+        The test case results are created upfront so that they're recorded in the same order
+        as when executing the test cases sequentially. The workers are threads, since the test
+        cases share the connections to the SUT and TG nodes, which can't be moved to other
+        processes.
+
+        Only the main thread receives :exc:`KeyboardInterrupt`. When it does, the test cases
+        which haven't started yet are cancelled and the run is stopped once the running
+        test cases finish.
+
+        The command history of the SUT and TG sessions is shared by the concurrently executed
+        test cases, so it's not logged when a test case fails.
+        """
+        scheduled_test_cases = [
+            (test_case_method, self._result.add_test_case(test_case_method.__name__))
+            for test_case_method in self._get_functional_test_cases()
+        ]
+        self._executing_concurrently = True
+        try:
+            with ThreadPoolExecutor(max_workers=SETTINGS.parallel_tests) as executor:
+                futures = [
+                    executor.submit(
+                        self._run_test_case_attempts,
+                        test_case_method,
+                        test_case_result,
+                        all_attempts,
                     )
-                    self._run_test_case(test_case_method, test_case_result)
+                    for test_case_method, test_case_result in scheduled_test_cases
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except KeyboardInterrupt:
+                    self._logger.error("Concurrent test case execution INTERRUPTED by user.")
+                    executor.shutdown(cancel_futures=True)
+                    raise KeyboardInterrupt("Stop DTS")
+        finally:
+            self._executing_concurrently = False
+
+    def _run_test_case_attempts(
+        self, test_case_method: MethodType, test_case_result: TestCaseResult, all_attempts: int
+    ) -> None:
+        """Run a test case and re-run it in case of a failure, up to `all_attempts` times."""
+        test_case_name = test_case_method.__name__
+        attempt_nr = 1
+        passed = self._run_test_case(test_case_method, test_case_result)
+        while not passed and attempt_nr < all_attempts:
+            attempt_nr += 1
+            self._logger.info(
+                f"Re-running FAILED test case '{test_case_name}'. "
+                f"Attempt number {attempt_nr} out of {all_attempts}."
+            )
+            passed = self._run_test_case(test_case_method, test_case_result)
 
     def _get_functional_test_cases(self) -> list[MethodType]:
         """Get all functional test cases defined in this TestSuite.
@@ -446,37 +635,40 @@ def _get_functional_test_cases(self) -> list[MethodType]:
         Returns:
             The list of functional test cases of this TestSuite.
         """
-        return self._get_test_cases(r"test_(?!perf_)")
+        return self._get_test_cases(self._functional_test_case_names)
 
-    def _get_test_cases(self, test_case_regex: str) -> list[MethodType]:
-        """Return a list of test cases matching test_case_regex.
+    def _get_test_cases(self, test_case_names: tuple[str, ...]) -> list[MethodType]:
+        """Return a list of test cases named in test_case_names which should be executed.
 
         Returns:
-            The list of test cases matching test_case_regex of this TestSuite.
+            The list of test cases of this TestSuite scheduled to be executed.
         """
         self._logger.debug(f"Searching for test cases in {self.__class__.__name__}.")
-        filtered_test_cases = []
-        for test_case_name, test_case in inspect.getmembers(self, inspect.ismethod):
-            if self._should_be_executed(test_case_name, test_case_regex):
-                filtered_test_cases.append(test_case)
+        filtered_test_cases = [
+            getattr(self, test_case_name)
+            for test_case_name in test_case_names
+            if self._should_be_executed(test_case_name)
+        ]
         cases_str = ", ".join((x.__name__ for x in filtered_test_cases))
         self._logger.debug(f"Found test cases '{cases_str}' in {self.__class__.__name__}.")
         return filtered_test_cases
 
-    def _should_be_executed(self, test_case_name: str, test_case_regex: str) -> bool:
+    def _should_be_executed(self, test_case_name: str) -> bool:
         """Check whether the test case should be scheduled to be executed."""
-        match = bool(re.match(test_case_regex, test_case_name))
         if self._test_cases_to_run:
-            return match and test_case_name in self._test_cases_to_run
+            return test_case_name in self._test_cases_to_run
 
-        return match
+        return True
 
     def _run_test_case(
         self, test_case_method: MethodType, test_case_result: TestCaseResult
-    ) -> None:
+    ) -> bool:
         """Setup, execute and teardown a test case in this suite.
 
         Record the result of the setup and the teardown and handle failures.
+
+        Returns:
+            :data:`True` if the test case passed, :data:`False` otherwise.
         """
         test_case_name = test_case_method.__name__
 
@@ -508,6 +700,8 @@ def _run_test_case(
                 test_case_result.update_teardown(Result.ERROR, e)
                 test_case_result.update(Result.ERROR)
 
+        return bool(test_case_result)
+
     def _execute_test_case(
         self, test_case_method: MethodType, test_case_result: TestCaseResult
     ) -> None:
@@ -534,6 +728,8 @@ def _execute_test_case(
 def get_test_suites(testsuite_module_path: str) -> list[type[TestSuite]]:
     r"""Find all :class:`TestSuite`\s in a Python module.
 
+    The test suites found in a module are remembered, so the module is searched only once.
+
     Args:
         testsuite_module_path: The path to the Python module.
 
@@ -543,20 +739,23 @@ def get_test_suites(testsuite_module_path: str) -> list[type[TestSuite]]:
     Raises:
         ConfigurationError: The test suite module was not found.
     """
+    return list(_get_test_suites(testsuite_module_path))
 
-    def is_test_suite(object: Any) -> bool:
-        try:
-            if issubclass(object, TestSuite) and object is not TestSuite:
-                return True
-        except TypeError:
-            return False
-        return False
 
+@functools.cache
+def _get_test_suites(testsuite_module_path: str) -> tuple[type[TestSuite], ...]:
     try:
-        testcase_module = importlib.import_module(testsuite_module_path)
+        testcase_module_spec = importlib.util.find_spec(testsuite_module_path)
     except ModuleNotFoundError as e:
         raise ConfigurationError(f"Test suite '{testsuite_module_path}' not found.") from e
-    return [
+    if testcase_module_spec is None:
+        raise ConfigurationError(f"Test suite '{testsuite_module_path}' not found.")
+
+    testcase_module = importlib.import_module(testsuite_module_path)
+    return tuple(
         test_suite_class
-        for _, test_suite_class in inspect.getmembers(testcase_module, is_test_suite)
-    ]
+        for _, test_suite_class in sorted(vars(testcase_module).items())
+        if isinstance(test_suite_class, type)
+        and issubclass(test_suite_class, TestSuite)
+        and test_suite_class is not TestSuite
+    )
@@ -10,6 +10,7 @@
 """
 
 import json
+from collections.abc import Iterable
 from ipaddress import IPv4Interface, IPv6Interface
 from typing import TypedDict, Union
 
@@ -198,6 +199,21 @@ def configure_port_ip_address(
             verify=True,
         )
 
+    def configure_ports(
+        self,
+        port_addresses: Iterable[tuple[Union[IPv4Interface, IPv6Interface], Port]],
+        delete: bool,
+        enable: bool,
+    ) -> None:
+        """Overrides :meth:`~.os_session.OSSession.configure_ports`."""
+        command = "del" if delete else "add"
+        state = "up" if enable else "down"
+        commands = []
+        for address, port in port_addresses:
+            commands.append(f"ip address {command} {address} dev {port.logical_name}")
+            commands.append(f"ip link set dev {port.logical_name} {state}")
+        self.send_command(" && ".join(commands), privileged=True, verify=True)
+
     def configure_ipv4_forwarding(self, enable: bool) -> None:
         """Overrides :meth:`~.os_session.OSSession.configure_ipv4_forwarding`."""
         state = 1 if enable else 0
@@ -13,6 +13,7 @@
 """
 
 from abc import ABC
+from collections.abc import Iterable
 from ipaddress import IPv4Interface, IPv6Interface
 from typing import Any, Callable, Type, Union
 
@@ -293,6 +294,26 @@ def configure_port_ip_address(
         """
         self.main_session.configure_port_ip_address(address, port, delete)
 
+    def configure_ports(
+        self,
+        port_addresses: Iterable[tuple[Union[IPv4Interface, IPv6Interface], Port]],
+        delete: bool = False,
+        enable: bool = True,
+    ) -> None:
+        """Configure IP addresses and states of multiple ports on this node at once.
+
+        This is equivalent to calling :meth:`configure_port_ip_address`
+        and :meth:`configure_port_state` for each port, but saves round trips to the node.
+
+        Args:
+            port_addresses: The IP addresses with masks in CIDR format along with the ports
+                to which to add them. The addresses can be either IPv4 or IPv6.
+            delete: If :data:`True`, will delete the addresses from the ports
+                instead of adding them.
+            enable: :data:`True` to enable the ports, :data:`False` to disable them.
+        """
+        self.main_session.configure_ports(port_addresses, delete, enable)
+
     def close(self) -> None:
         """Close all connections and free other resources."""
         if self.main_session:
@@ -413,6 +413,24 @@ def configure_port_ip_address(
             delete: If :data:`True`, remove the IP address, otherwise configure it.
         """
 
+    @abstractmethod
+    def configure_ports(
+        self,
+        port_addresses: Iterable[tuple[Union[IPv4Interface, IPv6Interface], Port]],
+        delete: bool,
+        enable: bool,
+    ) -> None:
+        """Configure IP addresses and states of multiple ports in the operating system.
+
+        The implementation should configure all the ports with as few remote commands
+        as possible.
+
+        Args:
+            port_addresses: The addresses to configure along with the ports to configure them on.
+            delete: If :data:`True`, remove the IP addresses, otherwise configure them.
+            enable: If :data:`True`, enable the ports, otherwise shut them down.
+        """
+
     @abstractmethod
     def configure_ipv4_forwarding(self, enable: bool) -> None:
         """Enable IPv4 forwarding in the operating system.
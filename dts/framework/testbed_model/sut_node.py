@@ -114,6 +114,7 @@ class SutNode(Node):
     __remote_dpdk_dir: PurePath | None
     _app_compile_timeout: float
     _dpdk_kill_session: OSSession | None
+    _dpdk_apps_launched: bool
     _dpdk_version: str | None
     _node_info: NodeInfo | None
     _compiler_version: str | None
@@ -133,6 +134,7 @@ def __init__(self, node_config: SutNodeConfiguration):
         self.__remote_dpdk_dir = None
         self._app_compile_timeout = 90
         self._dpdk_kill_session = None
+        self._dpdk_apps_launched = True
         self._dpdk_timestamp = (
             f"{str(os.getpid())}_{time.strftime('%Y%m%d%H%M%S', time.localtime())}"
         )
@@ -232,6 +234,9 @@ def _set_up_build_target(self, build_target_config: BuildTargetConfiguration) ->
         # build targets
         self._dpdk_version = None
         self._compiler_version = None
+        # clean up at least once per build target, there may be DPDK apps left over from
+        # previous runs or launched outside of this class, such as meson unit tests
+        self._dpdk_apps_launched = True
         self._configure_build_target(build_target_config)
         self._copy_dpdk_tarball()
         self._build_dpdk()
@@ -330,14 +335,20 @@ def build_dpdk_app(self, app_name: str, **meson_dpdk_args: str | bool) -> PurePa
         )
 
     def kill_cleanup_dpdk_apps(self) -> None:
-        """Kill all dpdk applications on the SUT, then clean up hugepages."""
-        if self._dpdk_kill_session and self._dpdk_kill_session.is_alive():
-            # we can use the session if it exists and responds
-            self._dpdk_kill_session.kill_cleanup_dpdk_apps(self._dpdk_prefix_list)
-        else:
-            # otherwise, we need to (re)create it
+        """Kill all dpdk applications on the SUT, then clean up hugepages.
+
+        Nothing is done if no DPDK application has been launched since the last cleanup.
+        The cleanup is always done at least once per build target.
+        """
+        if not self._dpdk_apps_launched:
+            return
+
+        if not (self._dpdk_kill_session and self._dpdk_kill_session.is_alive()):
+            # we can only use the session if it exists and responds, otherwise (re)create it
             self._dpdk_kill_session = self.create_session("dpdk_kill")
+        self._dpdk_kill_session.kill_cleanup_dpdk_apps(self._dpdk_prefix_list)
         self._dpdk_prefix_list = []
+        self._dpdk_apps_launched = False
 
     def create_eal_parameters(
         self,
@@ -413,6 +424,7 @@ def run_dpdk_app(
         Returns:
             The result of the DPDK app execution.
         """
+        self._dpdk_apps_launched = True
         return self.main_session.send_command(
             f"{app_path} {eal_args}", timeout, privileged=True, verify=True
         )
@@ -458,6 +470,7 @@ def create_interactive_shell(
 
         # We need to append the build directory for DPDK apps
         if shell_cls.dpdk_app:
+            self._dpdk_apps_launched = True
             shell_cls.path = self.main_session.join_remote_path(
                 self.remote_dpdk_build_dir, shell_cls.path
             )
@@ -9,6 +9,8 @@
 A TG node is where the TG runs.
 """
 
+from threading import Lock
+
 from scapy.packet import Packet  # type: ignore[import]
 
 from framework.config import TGNodeConfiguration
@@ -30,11 +32,15 @@ class TGNode(Node):
     Not all traffic generators are capable of capturing traffic, which is why there
     must be a way to send traffic without that.
 
+    The traffic generator is used by one caller at a time, since the traffic captures
+    of concurrent callers would contain each other's traffic.
+
     Attributes:
         traffic_generator: The traffic generator running on the node.
     """
 
     traffic_generator: CapturingTrafficGenerator
+    _traffic_generator_lock: Lock
 
     def __init__(self, node_config: TGNodeConfiguration):
         """Extend the constructor with TG node specifics.
@@ -45,6 +51,7 @@ def __init__(self, node_config: TGNodeConfiguration):
             node_config: The TG node's test run configuration.
         """
         super(TGNode, self).__init__(node_config)
+        self._traffic_generator_lock = Lock()
         self.traffic_generator = create_traffic_generator(self, node_config.traffic_generator)
         self._logger.info(f"Created node: {self.name}")
 
@@ -54,6 +61,7 @@ def send_packet_and_capture(
         send_port: Port,
         receive_port: Port,
         duration: float = 1,
+        stop_filter: dict[str, dict[str, str]] | None = None,
     ) -> list[Packet]:
         """Send `packet`, return received traffic.
 
@@ -66,13 +74,48 @@ def send_packet_and_capture(
             send_port: The egress port on the TG node.
             receive_port: The ingress port in the TG node.
             duration: Capture traffic for this amount of time after sending `packet`.
+            stop_filter: If given, stop capturing before `duration` elapses once a packet
+                with these field values is received. The keys are layer names (e.g. ``IP``)
+                and the values map field names of the layer to the field values.
+
+        Returns:
+             A list of received packets. May be empty if no packets are captured.
+        """
+        with self._traffic_generator_lock:
+            return self.traffic_generator.send_packet_and_capture(
+                packet, send_port, receive_port, duration, stop_filter=stop_filter
+            )
+
+    def send_packets_and_capture(
+        self,
+        packets: list[Packet],
+        send_port: Port,
+        receive_port: Port,
+        duration: float = 1,
+        stop_filter: dict[str, dict[str, str]] | None = None,
+    ) -> list[Packet]:
+        """Send `packets`, return received traffic.
+
+        Send `packets` on `send_port` and then return all traffic captured
+        on `receive_port` for the given duration. All `packets` are sent in a single capture.
+        Also record the captured traffic in a pcap file.
+
+        Args:
+            packets: The packets to send.
+            send_port: The egress port on the TG node.
+            receive_port: The ingress port in the TG node.
+            duration: Capture traffic for this amount of time after sending `packets`.
+            stop_filter: If given, stop capturing before `duration` elapses once a packet
+                with these field values is received. The keys are layer names (e.g. ``IP``)
+                and the values map field names of the layer to the field values.
 
         Returns:
              A list of received packets. May be empty if no packets are captured.
         """
-        return self.traffic_generator.send_packet_and_capture(
-            packet, send_port, receive_port, duration
-        )
+        with self._traffic_generator_lock:
+            return self.traffic_generator.send_packets_and_capture(
+                packets, send_port, receive_port, duration, stop_filter=stop_filter
+            )
 
     def close(self) -> None:
         """Free all resources used by the node.
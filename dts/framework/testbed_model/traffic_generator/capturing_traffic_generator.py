@@ -56,6 +56,7 @@ def send_packet_and_capture(
         receive_port: Port,
         duration: float,
         capture_name: str = _get_default_capture_name(),
+        stop_filter: dict[str, dict[str, str]] | None = None,
     ) -> list[Packet]:
         """Send `packet` and capture received traffic.
 
@@ -70,12 +71,15 @@ def send_packet_and_capture(
             receive_port: The ingress port in the TG node.
             duration: Capture traffic for this amount of time after sending the packet.
             capture_name: The name of the .pcap file where to store the capture.
+            stop_filter: If given, stop capturing before `duration` elapses once a packet
+                with these field values is received. The keys are layer names (e.g. ``IP``)
+                and the values map field names of the layer to the field values.
 
         Returns:
              The received packets. May be empty if no packets are captured.
         """
         return self.send_packets_and_capture(
-            [packet], send_port, receive_port, duration, capture_name
+            [packet], send_port, receive_port, duration, capture_name, stop_filter
         )
 
     def send_packets_and_capture(
@@ -85,6 +89,7 @@ def send_packets_and_capture(
         receive_port: Port,
         duration: float,
         capture_name: str = _get_default_capture_name(),
+        stop_filter: dict[str, dict[str, str]] | None = None,
     ) -> list[Packet]:
         """Send `packets` and capture received traffic.
 
@@ -101,6 +106,9 @@ def send_packets_and_capture(
             receive_port: The ingress port in the TG node.
             duration: Capture traffic for this amount of time after sending the packets.
             capture_name: The name of the .pcap file where to store the capture.
+            stop_filter: If given, stop capturing before `duration` elapses once a packet
+                with these field values is received. The keys are layer names (e.g. ``IP``)
+                and the values map field names of the layer to the field values.
 
         Returns:
              The received packets. May be empty if no packets are captured.
@@ -114,6 +122,7 @@ def send_packets_and_capture(
             send_port,
             receive_port,
             duration,
+            stop_filter,
         )
 
         self._logger.debug(f"Received packets: {get_packet_summaries(received_packets)}")
@@ -127,11 +136,13 @@ def _send_packets_and_capture(
         send_port: Port,
         receive_port: Port,
         duration: float,
+        stop_filter: dict[str, dict[str, str]] | None,
     ) -> list[Packet]:
         """The implementation of :method:`send_packets_and_capture`.
 
         The subclasses must implement this method which sends `packets` on `send_port`
-        and receives packets on `receive_port` for the specified `duration`.
+        and receives packets on `receive_port` for the specified `duration`,
+        or until a packet matching `stop_filter` is received, if given.
 
         It must be able to handle receiving no packets.
         """
@@ -30,10 +30,7 @@
 from framework.testbed_model.node import Node
 from framework.testbed_model.port import Port
 
-from .capturing_traffic_generator import (
-    CapturingTrafficGenerator,
-    _get_default_capture_name,
-)
+from .capturing_traffic_generator import CapturingTrafficGenerator
 
 """
 ========= BEGIN RPC FUNCTIONS =========
@@ -63,12 +60,22 @@
     "import time",
 ]
 
+"""
+Add the line needed to configure Scapy in a normal python environment
+as an entry to this array. It will be executed after the imports.
+"""
+SCAPY_RPC_SERVER_CONFIG = [
+    # capture with libpcap, Scapy falls back to its native sockets if libpcap is unavailable
+    "conf.use_pcap = True",
+]
+
 
 def scapy_send_packets_and_capture(
     xmlrpc_packets: list[xmlrpc.client.Binary],
     send_iface: str,
     recv_iface: str,
     duration: float,
+    stop_filter: dict[str, dict[str, str]] | None,
 ) -> list[bytes]:
     """The RPC function to send and capture packets.
 
@@ -80,20 +87,42 @@ def scapy_send_packets_and_capture(
         send_iface: The logical name of the egress interface.
         recv_iface: The logical name of the ingress interface.
         duration: Capture for this amount of time, in seconds.
+        stop_filter: If given, stop capturing before `duration` elapses once a packet
+            with these field values is received. The keys are layer names and the values
+            map field names of the layer to the field values.
 
     Returns:
         A list of bytes. Each item in the list represents one packet, which needs
         to be converted back upon transfer from the remote node.
     """
+    stop_filter_fields: dict[str, dict[str, str]] = stop_filter or {}
+
+    def matches_stop_filter(packet: Packet) -> bool:
+        return all(
+            packet.haslayer(layer)
+            and all(packet[layer].getfieldval(field) == value for field, value in fields.items())
+            for layer, fields in stop_filter_fields.items()
+        )
+
     scapy_packets = [scapy.all.Packet(packet.data) for packet in xmlrpc_packets]
     sniffer = scapy.all.AsyncSniffer(
         iface=recv_iface,
         store=True,
         started_callback=lambda *args: scapy.all.sendp(scapy_packets, iface=send_iface),
+        stop_filter=matches_stop_filter if stop_filter_fields else None,
     )
     sniffer.start()
-    time.sleep(duration)
-    return [scapy_packet.build() for scapy_packet in sniffer.stop(join=True)]
+    sniffer.join(timeout=duration)
+    try:
+        sniffer.stop()
+    except scapy.all.Scapy_Exception:
+        # the sniffer may have stopped on its own after receiving a packet matching
+        # the stop filter, the thread is then finishing or already finished;
+        # the sniffer may also not be ready to be stopped, which must not be ignored
+        sniffer.join(timeout=1)
+        if sniffer.thread.is_alive():
+            raise
+    return [scapy_packet.build() for scapy_packet in sniffer.results]
 
 
 def scapy_send_packets(xmlrpc_packets: list[xmlrpc.client.Binary], send_iface: str) -> None:
@@ -222,6 +251,10 @@ def __init__(self, tg_node: Node, config: ScapyTrafficGeneratorConfig):
         for import_statement in SCAPY_RPC_SERVER_IMPORTS:
             self.session.send_command(import_statement)
 
+        # configure scapy in remote python console
+        for config_statement in SCAPY_RPC_SERVER_CONFIG:
+            self.session.send_command(config_statement)
+
         # start the server
         xmlrpc_server_listen_port = 8000
         self._start_xmlrpc_server_in_remote_python(xmlrpc_server_listen_port)
@@ -266,7 +299,7 @@ def _send_packets_and_capture(
         send_port: Port,
         receive_port: Port,
         duration: float,
-        capture_name: str = _get_default_capture_name(),
+        stop_filter: dict[str, dict[str, str]] | None = None,
     ) -> list[Packet]:
         binary_packets = [packet.build() for packet in packets]
 
@@ -277,6 +310,7 @@ def _send_packets_and_capture(
             send_port.logical_name,
             receive_port.logical_name,
             duration,
+            stop_filter,
         )  # type: ignore[assignment]
 
         scapy_packets = [Ether(packet.data) for packet in xmlrpc_packets]
@@ -36,7 +36,7 @@ def test_os_udp(self) -> None:
         """
         packet = Ether() / IP() / UDP()
 
-        received_packets = self.send_packet_and_capture(packet)
+        received_packets = self.send_packet_and_capture(packet, stop_early=True)
 
         expected_packet = self.get_expected_packet(packet)
 